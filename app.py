@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------
 # Config
@@ -10,6 +11,7 @@ DATA_DIR = "data"
 MONTHS = ["Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
           "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"]
 JUGADORES_COL = "nombre"
+MAX_WORKERS = 4   # categorías que se leen a la vez
 
 # ---------------------------
 # Utilidades de archivo
@@ -43,6 +45,26 @@ def load_category(cat):
     cols = [JUGADORES_COL] + [c for c in df.columns if c != JUGADORES_COL]
     return df[cols]
 
+def load_all_categories(categories=CATEGORIES, max_workers=MAX_WORKERS):
+    """Lee todas las categorías en paralelo y las une en un solo DataFrame con columna 'categoria'.
+
+    Devuelve (df, errores). Si una categoría falla, se reporta en `errores` (cat -> mensaje)
+    y las demás se cargan igual.
+    """
+    frames, errores = [], {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {cat: pool.submit(load_category, cat) for cat in categories}
+        for cat, fut in futures.items():
+            try:
+                frames.append(fut.result().assign(categoria=cat))
+            except Exception as e:
+                errores[cat] = str(e)
+    if not frames:
+        return pd.DataFrame(columns=["categoria", JUGADORES_COL] + MONTHS), errores
+    df = pd.concat(frames, ignore_index=True)
+    cols = ["categoria"] + [c for c in df.columns if c != "categoria"]
+    return df[cols], errores
+
 def save_category(cat, df):
     df.to_csv(category_path(cat), index=False)
 
@@ -232,6 +254,12 @@ elif page == "Exportar / Backup":
     if not df.empty:
         st.download_button("📥 Descargar CSV de categoría actual", data=df.to_csv(index=False).encode('utf-8'), file_name=f"{selected_cat}.csv", mime="text/csv")
 
+    if st.button("Unir todas las categorías en un CSV"):
+        df_all, errores = load_all_categories()
+        for cat, err in errores.items():
+            st.warning(f"No se pudo leer {cat}: {err}")
+        st.download_button("📥 Descargar CSV de todas las categorías", data=df_all.to_csv(index=False).encode('utf-8'), file_name="todas_categorias.csv", mime="text/csv")
+
     if st.button("Crear backup (todos los CSV → zip)"):
         import zipfile, io
         buffer = io.BytesIO()
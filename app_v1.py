@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import gspread
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2.service_account import Credentials
 
 # ===============================
@@ -25,6 +26,9 @@ client = gspread.authorize(creds)
 SPREADSHEET_NAME = "Pagos"
 spreadsheet = client.open(SPREADSHEET_NAME)
 
+# Máximo de hojas que se piden a la API al mismo tiempo (para no chocar con la cuota de Sheets)
+MAX_WORKERS = 4
+
 # ===============================
 # 2️⃣  FUNCIONES AUXILIARES
 # ===============================
@@ -36,6 +40,25 @@ def load_category_df(sheet_name):
     return pd.DataFrame(data) if data else pd.DataFrame(columns=["Jugador"] + meses)
 
 
+def load_all_categories_df(sheet_names, max_workers=MAX_WORKERS):
+    """Carga varias categorías con peticiones concurrentes y las une con una columna "Categoría".
+
+    Devuelve (df, errores); una hoja que falle no impide cargar las demás.
+    """
+    frames, errores = [], {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {name: pool.submit(load_category_df, name) for name in sheet_names}
+        for name, fut in futures.items():
+            try:
+                frames.append(fut.result().assign(**{"Categoría": name}))
+            except Exception as e:
+                errores[name] = str(e)
+    if not frames:
+        return pd.DataFrame(columns=["Categoría", "Jugador"] + meses), errores
+    df = pd.concat(frames, ignore_index=True)
+    return df[["Categoría"] + [c for c in df.columns if c != "Categoría"]], errores
+
+
 def save_category_df(sheet_name, df):
     """Guarda un DataFrame completo en la hoja"""
     sheet = spreadsheet.worksheet(sheet_name)
@@ -90,7 +113,7 @@ meses = [
 categorias = ["sub11", "sub12", "sub13"]
 categoria = st.sidebar.selectbox("📁 Elegir categoría", categorias)
 
-menu = st.sidebar.radio("📂 Navegación", ["👥 Gestión de jugadores", "💸 Registrar pago", "📊 Ver pagos"])
+menu = st.sidebar.radio("📂 Navegación", ["👥 Gestión de jugadores", "💸 Registrar pago", "📊 Ver pagos", "🏫 Toda la escuela"])
 
 # ===============================
 # 4️⃣  GESTIÓN DE JUGADORES
@@ -139,3 +162,15 @@ elif menu == "📊 Ver pagos":
     else:
         st.dataframe(df)
 
+# ===============================
+# 7️⃣  TODA LA ESCUELA
+# ===============================
+elif menu == "🏫 Toda la escuela":
+    st.header("🏫 Pagos de todas las categorías")
+    df, errores = load_all_categories_df(categorias)
+    for name, err in errores.items():
+        st.warning(f"No se pudo cargar {name}: {err}")
+    if df.empty:
+        st.info("No hay datos para mostrar.")
+    else:
+        st.dataframe(df)
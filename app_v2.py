@@ -1,13 +1,15 @@
 # app.py
 import streamlit as st
 import pandas as pd
+import numpy as np
 import io
 import os
+import threading
+import time
 from datetime import datetime
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
-import openpyxl
+from types import MappingProxyType
+# googleapiclient, google.oauth2 y openpyxl se importan de forma diferida (al primer uso)
+# para que el primer render de la página no espere a cargarlos.
 
 st.set_page_config(page_title="Pagos Escuela de Fútbol", layout="wide")
 
@@ -20,6 +22,14 @@ meses = [
 ]
 categorias = [str(y) for y in range(2011, 2022)]  # 2011..2021
 
+# Cuotas esperadas (para calcular quién debe)
+CUOTA_MENSUAL = 50000
+# Cuota por categoría y mes; los meses que no aparezcan usan CUOTA_MENSUAL (0 = mes sin cobro)
+CUOTAS_MENSUALES = {c: {} for c in categorias}
+CUOTA_UNIFORME = 0          # valor esperado del uniforme por jugador (0 = no se cobra)
+CUOTA_TORNEO = 0            # cuota por inscripción a torneo cuando no está en CUOTAS_TORNEO
+CUOTAS_TORNEO = {}          # "Nombre Torneo" -> cuota
+
 # ===============================
 # 1️⃣  CONFIG: Credenciales & Drive API
 # ===============================
@@ -28,15 +38,20 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.file",
 ]
 
-# st.secrets["gcp"] debe contener el JSON del service account
-creds_info = st.secrets["gcp"]
-creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
-
 @st.cache_resource
 def get_drive_service():
-    return build("drive", "v3", credentials=creds)
+    """Construye (una vez por proceso) las credenciales y el cliente de Drive.
+
+    Desde googleapiclient 2.0 el discovery estático (sin pedir el documento por red)
+    ya es el valor por defecto; aquí solo se deja explícito.
+    """
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
 
-drive_service = get_drive_service()
+    # st.secrets["gcp"] debe contener el JSON del service account
+    creds_info = st.secrets["gcp"]
+    creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
+    return build("drive", "v3", credentials=creds, static_discovery=True, cache_discovery=False)
 
 # Nombre del archivo en Drive
 DRIVE_FILENAME = "Pagos.xlsx"
@@ -47,16 +62,29 @@ TMP_FILEPATH = "/tmp/pagos_drive.xlsx"
 # ===============================
 # 2️⃣ UTIL: Operaciones con Drive y Excel
 # ===============================
-def find_file_id_by_name(name):
-    """Busca en Drive por nombre (en Mi unidad) y devuelve fileId o None."""
+# campos que identifican una revisión del archivo (cambian cada vez que se sube contenido nuevo)
+REVISION_FIELDS = "id, md5Checksum, modifiedTime"
+
+def file_revision(meta):
+    """(md5Checksum, modifiedTime) de la metadata de Drive, o None si no hay archivo."""
+    return (meta.get("md5Checksum"), meta.get("modifiedTime")) if meta else None
+
+def find_file_by_name(name):
+    """Busca en Drive por nombre (en Mi unidad) y devuelve su metadata (id + revisión) o None."""
     query = f"name = '{name}' and trashed = false"
-    res = drive_service.files().list(q=query, spaces='drive', fields="files(id, name, mimeType)").execute()
+    res = get_drive_service().files().list(q=query, spaces='drive', fields=f"files({REVISION_FIELDS}, name, mimeType)").execute()
     files = res.get("files", [])
-    return files[0]["id"] if files else None
+    return files[0] if files else None
+
+def find_file_id_by_name(name):
+    """Busca en Drive por nombre (en Mi unidad) y devuelve fileId o None."""
+    meta = find_file_by_name(name)
+    return meta["id"] if meta else None
 
 def download_file_to_tmp(file_id, dest_path=TMP_FILEPATH):
     """Descarga un archivo de Drive a ruta temporal."""
-    request = drive_service.files().get_media(fileId=file_id)
+    from googleapiclient.http import MediaIoBaseDownload
+    request = get_drive_service().files().get_media(fileId=file_id)
     fh = io.FileIO(dest_path, 'wb')
     downloader = MediaIoBaseDownload(fh, request)
     done = False
@@ -67,25 +95,30 @@ def download_file_to_tmp(file_id, dest_path=TMP_FILEPATH):
 
 def upload_file_replace(file_id, local_path, mime_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'):
     """Reemplaza un archivo existente en Drive con el contenido local."""
+    from googleapiclient.http import MediaFileUpload
     media = MediaFileUpload(local_path, mimetype=mime_type, resumable=True)
-    updated = drive_service.files().update(fileId=file_id, media_body=media).execute()
+    updated = get_drive_service().files().update(fileId=file_id, media_body=media, fields=REVISION_FIELDS).execute()
     return updated
 
 def create_file_from_local(local_path, name=DRIVE_FILENAME, mime_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'):
     """Crea un nuevo archivo en Drive a partir de un archivo local."""
+    from googleapiclient.http import MediaFileUpload
     file_metadata = {"name": name}
     media = MediaFileUpload(local_path, mimetype=mime_type, resumable=True)
-    newf = drive_service.files().create(body=file_metadata, media_body=media, fields="id").execute()
+    newf = get_drive_service().files().create(body=file_metadata, media_body=media, fields=REVISION_FIELDS).execute()
     return newf
 
-def load_excel_from_drive():
+def load_excel_from_drive(file_id=None):
     """Asegura que exista el archivo y lo carga en un dict de DataFrames (sheet_name -> df)."""
-    file_id = find_file_id_by_name(DRIVE_FILENAME)
+    if file_id is None:
+        file_id = find_file_id_by_name(DRIVE_FILENAME)
     if file_id:
         # descargar
         download_file_to_tmp(file_id)
         try:
-            xls = pd.read_excel(TMP_FILEPATH, sheet_name=None, engine="openpyxl")
+            # los montos se leen como texto: si no, read_excel convierte "50.000" en 50.0
+            xls = pd.read_excel(TMP_FILEPATH, sheet_name=None, engine="openpyxl",
+                                converters={c: str for c in meses + ["Valor"]})
         except Exception:
             # archivo vacío o corrupto -> crear estructura vacía
             xls = {}
@@ -103,10 +136,22 @@ def load_excel_from_drive():
         xls["Uniformes"] = pd.DataFrame(columns=["Jugador", "Categoría", "Fecha", "Valor", "Observaciones"])
     if "Torneos" not in xls:
         xls["Torneos"] = pd.DataFrame(columns=["Jugador", "Categoría", "Nombre Torneo", "Fecha", "Valor", "Observaciones"])
+    # montos escritos como texto ("50.000") se pasan a número una sola vez, al cargar,
+    # para que el cálculo de saldos siempre vaya por el camino numérico rápido
+    for c in categorias:
+        cols = [m for m in meses if m in xls[c].columns]
+        if cols and len(xls[c]):
+            xls[c][cols] = xls[c][cols].apply(_to_amount)
+    for hoja in ["Uniformes", "Torneos"]:
+        if "Valor" in xls[hoja].columns and len(xls[hoja]):
+            xls[hoja]["Valor"] = _to_amount(xls[hoja]["Valor"])
     return xls, file_id
 
 def save_excel_and_upload(xls_dict, file_id=None):
-    """Guarda dict de DataFrames a Excel local y sube a Drive (crea o reemplaza)."""
+    """Guarda dict de DataFrames a Excel local y sube a Drive (crea o reemplaza).
+
+    Devuelve (file_id, revisión subida).
+    """
     # grabar localmente
     with pd.ExcelWriter(TMP_FILEPATH, engine="openpyxl") as writer:
         for sheet_name, df in xls_dict.items():
@@ -116,25 +161,119 @@ def save_excel_and_upload(xls_dict, file_id=None):
             df_to_write.to_excel(writer, sheet_name=sheet_name, index=False)
     # subir
     if file_id:
-        upload_file_replace(file_id, TMP_FILEPATH)
+        meta = upload_file_replace(file_id, TMP_FILEPATH)
     else:
-        newf = create_file_from_local(TMP_FILEPATH, name=DRIVE_FILENAME)
-        file_id = newf.get("id")
+        meta = create_file_from_local(TMP_FILEPATH, name=DRIVE_FILENAME)
+        file_id = meta.get("id")
     # opcional: eliminar tmp
     try:
         os.remove(TMP_FILEPATH)
     except Exception:
         pass
-    return file_id
+    return file_id, file_revision(meta)
 
 # ===============================
 # 3️⃣  FUNCIONES PRINCIPALES (lectura y escritura local+drive)
 # ===============================
-@st.cache_data(ttl=60)
-def load_all_from_drive_cached():
-    # cachea la lectura por 60s para evitar múltiples descargas seguidas
-    xls, fid = load_excel_from_drive()
-    return xls, fid
+# Cada cuántos segundos se vuelve a descargar el archivo desde Drive
+RELOAD_TTL = 60
+
+class WorkbookSnapshot:
+    """Versión inmutable del libro: hojas (solo lectura), fileId y número de versión."""
+    def __init__(self, sheets, file_id, version):
+        self.sheets = MappingProxyType(dict(sheets))
+        self.file_id = file_id
+        self.version = version
+        self._balances = {}  # hasta_mes -> saldo calculado para esta versión
+        self._balances_lock = threading.Lock()
+
+    def balances(self, hasta_mes):
+        """Saldo de toda la escuela para esta versión (se calcula una sola vez)."""
+        with self._balances_lock:
+            saldo = self._balances.get(hasta_mes)
+            if saldo is None:
+                saldo = self._balances[hasta_mes] = compute_balances(self.sheets, hasta_mes)
+            return saldo
+
+    def cached_balances(self):
+        """Copia de los saldos ya calculados (hasta_mes -> saldo)."""
+        with self._balances_lock:
+            return dict(self._balances)
+
+class WorkbookStore:
+    """Estado del libro compartido por todas las sesiones del proceso.
+
+    Los lectores obtienen el snapshot actual sin copiar nada. Los escritores
+    trabajan sobre un dict nuevo (las hojas que no tocan se comparten) y
+    publican una versión nueva; si otra sesión publicó antes, la escritura se rechaza.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._revision = None  # revisión de Drive que corresponde al snapshot actual
+        self._loaded_at = 0.0
+
+    def _publish(self, sheets, file_id):
+        version = self._snapshot.version + 1 if self._snapshot else 1
+        self._snapshot = WorkbookSnapshot(sheets, file_id, version)
+        return self._snapshot
+
+    def snapshot(self):
+        """Devuelve el snapshot actual; lo (re)carga desde Drive si no existe o venció el TTL."""
+        snap = self._snapshot
+        if snap is not None and not self._expired():
+            return snap
+        with self._lock:
+            # otra sesión pudo recargar mientras esperábamos el lock
+            if self._snapshot is not None and not self._expired():
+                return self._snapshot
+            return self._reload_locked()
+
+    def reload(self):
+        """Trae la última versión desde Drive (sin esperar al TTL)."""
+        with self._lock:
+            return self._reload_locked()
+
+    def _expired(self):
+        return time.monotonic() - self._loaded_at >= RELOAD_TTL
+
+    def _reload_locked(self):
+        # primero solo la metadata: si la revisión en Drive es la misma, no se descarga nada
+        # y se conserva la versión para no invalidar las sesiones
+        meta = find_file_by_name(DRIVE_FILENAME)
+        fid, revision = (meta["id"] if meta else None), file_revision(meta)
+        self._loaded_at = time.monotonic()
+        current = self._snapshot
+        if current is not None and current.file_id == fid and self._revision == revision:
+            return current
+        xls, fid = load_excel_from_drive(fid)
+        self._revision = revision
+        return self._publish(xls, fid)
+
+    def commit(self, sheets, base_version, touched=None):
+        """Guarda y sube `sheets` si nadie publicó desde `base_version`. Devuelve el snapshot nuevo o None.
+
+        `touched` = (categoria, jugador) indica que el cambio solo afecta a ese jugador,
+        así los saldos ya calculados se actualizan solo para él.
+        """
+        with self._lock:
+            current = self._snapshot
+            if current is None or current.version != base_version:
+                return None
+            file_id, self._revision = save_excel_and_upload(sheets, current.file_id)
+            new = self._publish(sheets, file_id)
+            if touched is not None:
+                categoria, jugador = touched
+                saldos = {hasta_mes: update_player_balance(saldo, new.sheets, categoria, jugador, hasta_mes)
+                          for hasta_mes, saldo in current.cached_balances().items()}
+                with new._balances_lock:
+                    new._balances.update(saldos)
+            return new
+
+@st.cache_resource
+def get_workbook_store():
+    # un único store por proceso, compartido entre sesiones
+    return WorkbookStore()
 
 def refresh_sheet_in_memory(xls, sheet_name):
     # reload the sheet from drive (used sparingly)
@@ -173,6 +312,8 @@ def update_monthly_in_xls(xls, categoria, jugador_nombre, mes, monto):
     mask = df_cat["Jugador"].astype(str) == str(jugador_nombre)
     if not mask.any():
         return False, "Jugador no encontrado en categoría."
+    # copiar solo esta hoja: el DataFrame original puede estar en un snapshot compartido
+    df_cat = df_cat.copy()
     df_cat.loc[mask, mes] = monto
     xls[categoria] = df_cat
     return True, "Pago actualizado en archivo local."
@@ -191,15 +332,119 @@ def append_torneo_in_xls(xls, jugador, categoria, nombre_torneo, fecha, valor, o
     xls["Torneos"] = df_t
     return True, "Torneo agregado en archivo local."
 
+# ===============================
+# 4️⃣.1  SALDOS: cuotas esperadas vs pagos (vectorizado)
+# ===============================
+SALDO_COLS = ["Jugador", "Categoría"] + meses + ["Mensualidades", "Uniformes", "Torneos", "Total"]
+
+def fee_matrix():
+    """Matriz (categorías x meses) con la cuota esperada de cada mes."""
+    return np.array([[CUOTAS_MENSUALES.get(c, {}).get(m, CUOTA_MENSUAL) for m in meses] for c in categorias],
+                    dtype=float)
+
+def _to_amount(s):
+    # montos guardados como número o texto ("50.000") -> float; vacíos/no numéricos cuentan como 0
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype(float).fillna(0.0)
+    texto = s.astype(str).str.strip()
+    # solo "50.000" / "1,250,000" se tratan como separadores de miles; "50000.0" se lee tal cual
+    miles = texto.str.fullmatch(r"\d{1,3}([.,]\d{3})+")
+    limpio = s.where(~miles, texto.str.replace(r"[.,]", "", regex=True))
+    return pd.to_numeric(limpio, errors="coerce").fillna(0.0)
+
+def compute_balances(sheets, hasta_mes):
+    """Saldo pendiente por jugador: cuota esperada menos lo pagado hasta `hasta_mes` (índice 0..11).
+
+    Las mensualidades de todas las categorías se calculan en una sola operación de NumPy
+    y luego se unen con lo que falta por pagar de Uniformes y Torneos.
+    """
+    frames, cat_idx = [], []
+    for i, c in enumerate(categorias):
+        df = sheets.get(c)
+        if df is None or df.empty:
+            continue
+        frames.append(df.reindex(columns=["Jugador"] + meses))
+        cat_idx.append(np.full(len(df), i))
+    if frames:
+        df_all = pd.concat(frames, ignore_index=True)
+        cat_idx = np.concatenate(cat_idx)
+        paid = df_all[meses].apply(_to_amount).to_numpy(dtype=float)
+        month_mask = np.arange(len(meses)) <= hasta_mes
+        debt = np.clip(fee_matrix()[cat_idx] - paid, 0, None) * month_mask
+        saldo = pd.DataFrame(debt, columns=meses)
+        saldo.insert(0, "Jugador", df_all["Jugador"].astype(str).to_numpy())
+        saldo.insert(1, "Categoría", np.asarray(categorias)[cat_idx])
+        saldo["Mensualidades"] = debt.sum(axis=1)
+    else:
+        saldo = pd.DataFrame({"Jugador": pd.Series(dtype=object), "Categoría": pd.Series(dtype=object),
+                              **{c: pd.Series(dtype=float) for c in meses + ["Mensualidades"]}})
+
+    # Regla para jugadores que no están en la hoja de su categoría: Torneos y Uniformes se unen
+    # con outer, así que aparecen igual, y cada (Jugador, Categoría) del resultado debe el uniforme.
+    keys = ["Jugador", "Categoría"]
+    # Torneos: cada inscripción debe su cuota (por torneo o CUOTA_TORNEO), menos lo abonado
+    df_t = sheets.get("Torneos")
+    if df_t is not None and not df_t.empty:
+        tor = df_t[keys].astype(str)
+        cuota = df_t["Nombre Torneo"].astype(str).map(CUOTAS_TORNEO).fillna(CUOTA_TORNEO)
+        tor = tor.assign(Torneos=np.clip(cuota.to_numpy(dtype=float) - _to_amount(df_t["Valor"]).to_numpy(), 0, None))
+        tor = tor.groupby(keys, as_index=False)["Torneos"].sum()
+        saldo = saldo.merge(tor, on=keys, how="outer")
+    else:
+        saldo["Torneos"] = 0.0
+    # Uniformes: se espera CUOTA_UNIFORME por jugador, menos lo abonado
+    df_uni = sheets.get("Uniformes")
+    if CUOTA_UNIFORME and df_uni is not None and not df_uni.empty:
+        uni = df_uni[keys].astype(str).assign(Valor=_to_amount(df_uni["Valor"]))
+        uni = uni.groupby(keys, as_index=False)["Valor"].sum()
+        saldo = saldo.merge(uni, on=keys, how="outer")
+        saldo["Uniformes"] = np.clip(CUOTA_UNIFORME - saldo.pop("Valor").fillna(0.0), 0, None)
+    else:
+        saldo["Uniformes"] = float(CUOTA_UNIFORME)
+    saldo[meses + ["Mensualidades", "Uniformes", "Torneos"]] = saldo[meses + ["Mensualidades", "Uniformes", "Torneos"]].fillna(0.0)
+    saldo["Total"] = saldo["Mensualidades"] + saldo["Uniformes"] + saldo["Torneos"]
+    return saldo[SALDO_COLS].reset_index(drop=True)
+
+def update_player_balance(saldo, sheets, categoria, jugador, hasta_mes):
+    """Recalcula solo las filas de un jugador sobre un saldo ya calculado (devuelve un DataFrame nuevo)."""
+    def only_player(df):
+        return df[df["Jugador"].astype(str) == str(jugador)] if df is not None and not df.empty else df
+    sub = {categoria: only_player(sheets.get(categoria))}
+    for hoja in ["Uniformes", "Torneos"]:
+        df = only_player(sheets.get(hoja))
+        sub[hoja] = df[df["Categoría"].astype(str) == str(categoria)] if df is not None and not df.empty else df
+    fila = compute_balances(sub, hasta_mes)
+    otros = saldo[~((saldo["Jugador"] == str(jugador)) & (saldo["Categoría"] == str(categoria)))]
+    return pd.concat([otros, fila], ignore_index=True)
+
 # ===============================
 # 5️⃣ INTERFAZ STREAMLIT (UI) - usa xls en memoria y sube cuando haya cambios
 # ===============================
 st.title("⚽ Sistema de pagos - Escuela de Fútbol (Drive Excel)")
 
-# Cargar inicialmente (cacheada)
-xls, file_id = load_all_from_drive_cached()
-
-menu = st.sidebar.radio("📂 Navegación", ["👥 Gestión de jugadores", "💸 Registrar pago", "📊 Ver datos", "🔁 Sincronizar"])
+menu = st.sidebar.radio("📂 Navegación", ["👥 Gestión de jugadores", "💸 Registrar pago", "📊 Ver datos", "💰 Deudores", "🔁 Sincronizar"])
+
+# Cargar inicialmente (cacheada). El título y la navegación ya están pintados,
+# así que la construcción del cliente de Drive y la descarga no dejan la página en blanco.
+store = get_workbook_store()
+with st.spinner("Cargando datos desde Drive..."):
+    snapshot = store.snapshot()
+xls = snapshot.sheets  # solo lectura; para modificar se usa una copia con dict(xls)
+
+# detectar si otra sesión publicó una versión nueva desde el último rerun
+seen_version = st.session_state.get("workbook_version")
+if seen_version is not None and seen_version != snapshot.version:
+    st.info(f"🔄 Datos actualizados a la versión {snapshot.version}.")
+st.session_state["workbook_version"] = snapshot.version
+
+def commit_changes(draft, touched=None):
+    """Publica `draft` como nueva versión; devuelve False si los datos cambiaron en otra sesión."""
+    new_snapshot = store.commit(draft, snapshot.version, touched)
+    if new_snapshot is None:
+        st.error("Los datos cambiaron en otra sesión. Recarga la página e intenta de nuevo.")
+        return False
+    st.session_state["workbook_version"] = new_snapshot.version
+    return True
 
 # ---------- GESTIÓN DE JUGADORES ----------
 if menu == "👥 Gestión de jugadores":
@@ -232,11 +477,12 @@ if menu == "👥 Gestión de jugadores":
                     "Correo": Correo.strip(),
                     "Contacto": Contacto.strip()
                 }
-                ok, msg = add_player_to_xls(xls, player_data)
+                draft = dict(xls)
+                ok, msg = add_player_to_xls(draft, player_data)
                 if ok:
-                    # guardar y subir a Drive (file_id puede ser None y será creado)
-                    file_id = save_excel_and_upload(xls, file_id)
-                    st.success("✅ " + msg + " (subido a Drive).")
+                    # guardar y subir a Drive (el archivo se crea si aún no existe)
+                    if commit_changes(draft):
+                        st.success("✅ " + msg + " (subido a Drive).")
                 else:
                     st.error(msg)
 
@@ -255,10 +501,10 @@ if menu == "👥 Gestión de jugadores":
                 # eliminar localmente
                 df = xls["Jugadores"]
                 if str(doc_to_delete) in df["Documento"].astype(str).values:
-                    df = df[df["Documento"].astype(str) != str(doc_to_delete)]
-                    xls["Jugadores"] = df
-                    file_id = save_excel_and_upload(xls, file_id)
-                    st.success("✅ Jugador eliminado y archivo actualizado.")
+                    draft = dict(xls)
+                    draft["Jugadores"] = df[df["Documento"].astype(str) != str(doc_to_delete)]
+                    if commit_changes(draft):
+                        st.success("✅ Jugador eliminado y archivo actualizado.")
                 else:
                     st.error("Documento no encontrado.")
 
@@ -277,10 +523,11 @@ elif menu == "💸 Registrar pago":
             mes = st.selectbox("Mes", meses)
             monto = st.number_input("Monto", min_value=0.0, step=1000.0)
             if st.button("Guardar mensualidad"):
-                ok, msg = update_monthly_in_xls(xls, categoria, jugador, mes, monto)
+                draft = dict(xls)
+                ok, msg = update_monthly_in_xls(draft, categoria, jugador, mes, monto)
                 if ok:
-                    file_id = save_excel_and_upload(xls, file_id)
-                    st.success("✅ " + msg + " (subido a Drive).")
+                    if commit_changes(draft, (categoria, jugador)):
+                        st.success("✅ " + msg + " (subido a Drive).")
                 else:
                     st.error(msg)
 
@@ -294,10 +541,11 @@ elif menu == "💸 Registrar pago":
         obs = st.text_input("Observaciones")
         if st.button("Registrar uniforme"):
             fecha_str = fecha.isoformat() if fecha else ""
-            ok, msg = append_uniform_in_xls(xls, jugador, categoria, fecha_str, valor, obs)
+            draft = dict(xls)
+            ok, msg = append_uniform_in_xls(draft, jugador, categoria, fecha_str, valor, obs)
             if ok:
-                file_id = save_excel_and_upload(xls, file_id)
-                st.success("✅ " + msg + " (subido a Drive).")
+                if commit_changes(draft, (categoria, jugador)):
+                    st.success("✅ " + msg + " (subido a Drive).")
             else:
                 st.error(msg)
 
@@ -312,10 +560,11 @@ elif menu == "💸 Registrar pago":
         obs = st.text_input("Observaciones")
         if st.button("Registrar torneo"):
             fecha_str = fecha.isoformat() if fecha else ""
-            ok, msg = append_torneo_in_xls(xls, jugador, categoria, nombre_torneo, fecha_str, valor, obs)
+            draft = dict(xls)
+            ok, msg = append_torneo_in_xls(draft, jugador, categoria, nombre_torneo, fecha_str, valor, obs)
             if ok:
-                file_id = save_excel_and_upload(xls, file_id)
-                st.success("✅ " + msg + " (subido a Drive).")
+                if commit_changes(draft, (categoria, jugador)):
+                    st.success("✅ " + msg + " (subido a Drive).")
             else:
                 st.error(msg)
 
@@ -323,7 +572,9 @@ elif menu == "💸 Registrar pago":
 elif menu == "🔁 Sincronizar":
     st.header("🔁 Sincronizar / Forzar descarga desde Drive")
     if st.button("Descargar última versión desde Drive"):
-        xls, file_id = load_excel_from_drive()
+        snapshot = store.reload()
+        xls = snapshot.sheets
+        st.session_state["workbook_version"] = snapshot.version
         st.success("✅ Archivo descargado y cargado en memoria.")
     st.markdown("---")
     st.subheader("Ver hojas")
@@ -336,12 +587,19 @@ elif menu == "📊 Ver datos":
     hoja = st.selectbox("Selecciona hoja para ver", ["Jugadores"] + categorias + ["Uniformes", "Torneos"])
     st.dataframe(xls.get(hoja, pd.DataFrame({"Info": ["No hay datos en esta hoja"]})))
 
-
-
-   
-
-
-
-
-
-
+# ---------- DEUDORES ----------
+elif menu == "💰 Deudores":
+    st.header("💰 ¿Quién debe qué?")
+    hasta = st.selectbox("Calcular hasta el mes", meses, index=datetime.now().month - 1)
+    saldo = snapshot.balances(meses.index(hasta))
+    cat_filter = st.selectbox("Categoría", ["Todas"] + categorias)
+    deudores = saldo[saldo["Total"] > 0]
+    if cat_filter != "Todas":
+        deudores = deudores[deudores["Categoría"] == cat_filter]
+    if deudores.empty:
+        st.success("✅ Nadie tiene saldo pendiente.")
+    else:
+        col1, col2 = st.columns(2)
+        col1.metric("Jugadores con deuda", len(deudores))
+        col2.metric("Total pendiente", f"{deudores['Total'].sum():,.0f}")
+        st.dataframe(deudores.sort_values("Total", ascending=False))
@@ -0,0 +1,40 @@
+# bench_startup.py
+# Mide cuánto cuesta importar los módulos pesados que app_v2.py cargaba al arrancar.
+# Uso: python bench_startup.py
+import subprocess
+import sys
+
+REPEAT = 5
+
+# Lo que se importa antes del primer render (ahora)
+LAZY = "import streamlit, pandas"
+# Lo que se importaba antes del primer render (antes)
+EAGER = (
+    "import streamlit, pandas, openpyxl; "
+    "from google.oauth2.service_account import Credentials; "
+    "from googleapiclient.discovery import build; "
+    "from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload"
+)
+# Construcción del cliente con discovery estático (sin red, credenciales anónimas)
+BUILD = (
+    "from googleapiclient.discovery import build; "
+    "build('drive', 'v3', developerKey='x', static_discovery=True, cache_discovery=False)"
+)
+
+def time_snippet(code):
+    """Ejecuta el código en un proceso nuevo y devuelve el mejor tiempo en segundos."""
+    runner = f"import time; t0 = time.perf_counter(); {code}; print(time.perf_counter() - t0)"
+    best = None
+    for _ in range(REPEAT):
+        out = subprocess.run([sys.executable, "-c", runner], capture_output=True, text=True, check=True)
+        t = float(out.stdout.strip().splitlines()[-1])
+        best = t if best is None else min(best, t)
+    return best
+
+if __name__ == "__main__":
+    lazy = time_snippet(LAZY)
+    eager = time_snippet(EAGER)
+    print(f"Imports antes del primer render (diferido): {lazy:.3f}s")
+    print(f"Imports antes del primer render (antes):    {eager:.3f}s")
+    print(f"Ahorro en arranque en frío:                 {eager - lazy:.3f}s")
+    print(f"Construcción de Drive (discovery estático): {time_snippet(BUILD):.3f}s")